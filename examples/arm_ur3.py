@@ -17,8 +17,11 @@
 
 """Universal Robots UR3 arm tracking a moving target."""
 
+import time
+
 import meshcat_shapes
 import numpy as np
+import pinocchio as pin
 import qpsolvers
 from loop_rate_limiters import RateLimiter
 
@@ -37,6 +40,21 @@ except ModuleNotFoundError:
     )
 
 
+def se3_into(transform: pin.SE3, out: np.ndarray) -> np.ndarray:
+    """Write a transform into a preallocated homogeneous matrix.
+
+    Args:
+        transform: Transform to write.
+        out: Homogeneous matrix to write to, with its last row already set.
+
+    Returns:
+        The output matrix.
+    """
+    np.copyto(out[:3, :3], transform.rotation)
+    np.copyto(out[:3, 3], transform.translation)
+    return out
+
+
 if __name__ == "__main__":
     robot = load_robot_description("ur3_description", root_joint=None)
     viz = start_meshcat_visualizer(robot)
@@ -66,36 +84,57 @@ if __name__ == "__main__":
     viz.display(configuration.q)
 
     viewer = viz.viewer
-    meshcat_shapes.frame(viewer["end_effector_target"], opacity=0.5)
-    meshcat_shapes.frame(viewer["end_effector"], opacity=1.0)
+    end_effector_target_view = viewer["end_effector_target"]
+    end_effector_view = viewer["end_effector"]
+    meshcat_shapes.frame(end_effector_target_view, opacity=0.5)
+    meshcat_shapes.frame(end_effector_view, opacity=1.0)
 
     # Select QP solver
     solver = qpsolvers.available_solvers[0]
     if "quadprog" in qpsolvers.available_solvers:
         solver = "quadprog"
 
+    # The task target is updated in place, and homogeneous matrices sent to
+    # the visualizer are written into preallocated buffers
+    end_effector_target = end_effector_task.transform_target_to_world
+    buffers = {name: np.eye(4) for name in ("target", "end_effector")}
+
     rate = RateLimiter(frequency=200.0)
     dt = rate.period
+    display_every = max(1, int(1.0 / (30.0 * dt)))  # visualize at ~30 FPS
+
+    # Deadlines advance by exactly one period, so that the loop frequency does
+    # not drift by the sleep overshoot of each step
+    period_ns = int(round(1e9 * dt))
+    deadline = time.monotonic_ns() + period_ns
+    step = 0
     t = 0.0  # [s]
     while True:
         # Update task targets
-        end_effector_target = end_effector_task.transform_target_to_world
         end_effector_target.translation[1] = 0.5 + 0.1 * np.sin(2.0 * t)
         end_effector_target.translation[2] = 0.2
 
-        # Update visualization frames
-        viewer["end_effector_target"].set_transform(end_effector_target.np)
-        viewer["end_effector"].set_transform(
-            configuration.get_transform_frame_to_world(
-                end_effector_task.body
-            ).np
-        )
-
         # Compute velocity and integrate it into next configuration
         velocity = solve_ik(configuration, tasks, dt, solver=solver)
         configuration.integrate_inplace(velocity, dt)
 
         # Visualize result at fixed FPS
-        viz.display(configuration.q)
-        rate.sleep()
+        if step % display_every == 0:
+            end_effector = configuration.get_transform_frame_to_world(
+                end_effector_task.body
+            )
+            end_effector_target_view.set_transform(
+                se3_into(end_effector_target, buffers["target"])
+            )
+            end_effector_view.set_transform(
+                se3_into(end_effector, buffers["end_effector"])
+            )
+            viz.display(configuration.q)
+        now = time.monotonic_ns()
+        if now < deadline:
+            time.sleep(1e-9 * (deadline - now))
+            deadline += period_ns
+        else:  # we are late: skip ahead rather than catch up
+            deadline = now + period_ns
+        step += 1
         t += dt
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2023 Inria
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare QP-based IK with a compiled Gauss-Newton step on a UR3 arm.
+
+The Gauss-Newton step solves the unconstrained version of the IK problem,
+without configuration or velocity limits, so that it is only a baseline to
+measure the overhead of building and solving the quadratic program.
+"""
+
+import time
+
+import numpy as np
+import pinocchio as pin
+import qpsolvers
+
+import pink
+from pink import solve_ik
+from pink.tasks import FrameTask
+from pink.utils import custom_configuration_vector
+
+try:
+    from numba import njit
+except ModuleNotFoundError:
+    raise ModuleNotFoundError(
+        "This example needs numba, try ``pip install numba``"
+    )
+
+try:
+    from robot_descriptions.loaders.pinocchio import load_robot_description
+except ModuleNotFoundError:
+    raise ModuleNotFoundError(
+        "Examples need robot_descriptions, "
+        "try ``pip install robot_descriptions``"
+    )
+
+
+@njit(cache=True, fastmath=True)
+def gauss_newton_step(J, e, W, damping):
+    r"""Compute a damped Gauss-Newton displacement.
+
+    This is the solution of the unconstrained IK problem for a single task:
+
+    .. math::
+
+        \Delta q = (J^T W^2 J + \lambda I)^{-1} J^T W^2 e
+
+    Args:
+        J: Task Jacobian.
+        e: Task error, multiplied by the task gain.
+        W: Diagonal of the task weight matrix, i.e. the task cost vector.
+        damping: Tikhonov damping :math:`\lambda`.
+
+    Returns:
+        Configuration displacement :math:`\Delta q`.
+    """
+    weighted_jacobian = W.reshape((-1, 1)) * J
+    weighted_error = W * e
+    H = weighted_jacobian.T @ weighted_jacobian
+    for i in range(H.shape[0]):
+        H[i, i] += damping
+    return np.linalg.solve(H, weighted_jacobian.T @ weighted_error)
+
+
+if __name__ == "__main__":
+    robot = load_robot_description("ur3_description", root_joint=None)
+    q_ref = custom_configuration_vector(
+        robot,
+        shoulder_lift_joint=1.0,
+        shoulder_pan_joint=1.0,
+        elbow_joint=1.0,
+    )
+
+    # Same task in both cases, without Levenberg-Marquardt damping so that
+    # both methods minimize the same objective
+    end_effector_task = FrameTask(
+        "ee_link",
+        position_cost=1.0,  # [cost] / [m]
+        orientation_cost=1.0,  # [cost] / [rad]
+        lm_damping=0.0,
+    )
+    configuration = pink.Configuration(robot.model, robot.data, q_ref)
+    end_effector_task.set_target(
+        configuration.get_transform_frame_to_world("ee_link")
+        * pin.SE3(np.eye(3), np.array([0.0, 0.05, 0.05]))
+    )
+
+    solver = qpsolvers.available_solvers[0]
+    if "quadprog" in qpsolvers.available_solvers:
+        solver = "quadprog"
+
+    damping = 1e-6  # [cost]^2 / [tangent]
+    dt = 5e-3  # [s]
+    nb_steps = 1000
+    gauss_newton_step(  # compile the kernel before timing it
+        np.zeros((6, robot.model.nv)),
+        np.zeros(6),
+        np.ones(6),
+        damping,
+    )
+
+    for method in ("solve_ik", "gauss_newton_step"):
+        configuration = pink.Configuration(robot.model, robot.data, q_ref)
+        duration = 0.0
+        for _ in range(nb_steps):
+            start = time.perf_counter()
+            if method == "solve_ik":
+                velocity = solve_ik(
+                    configuration,
+                    [end_effector_task],
+                    dt,
+                    solver=solver,
+                    damping=damping,
+                )
+            else:  # method == "gauss_newton_step"
+                Delta_q = gauss_newton_step(
+                    end_effector_task.compute_jacobian(configuration),
+                    end_effector_task.gain
+                    * end_effector_task.compute_error(configuration),
+                    end_effector_task.cost,
+                    damping,
+                )
+                velocity = Delta_q / dt
+            duration += time.perf_counter() - start
+            configuration.integrate_inplace(velocity, dt)
+        error = np.linalg.norm(end_effector_task.compute_error(configuration))
+        print(
+            f"{method}: {1e6 * duration / nb_steps:.1f} [us] per step, "
+            f"final task error {error:.2e}"
+        )
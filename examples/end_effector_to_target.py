@@ -1,5 +1,9 @@
 import pink
 import pinocchio
+from pink.visualization import (
+    play_meshcat_animation,
+    start_meshcat_visualizer,
+)
 from robot_descriptions.loaders.pinocchio import load_robot_description
 import numpy as np
 robot = load_robot_description("ur10_description")
@@ -44,6 +48,10 @@ pink_configuration = pink.Configuration(
     robot.model, robot.data, robot.q0
 )
 
+# Log configurations to replay them all at once after convergence
+q_log = np.empty((niter + 1, robot.model.nq))
+q_log[0] = pink_configuration.q
+
 for i in range(niter):
     dv = pink.solve_ik(
         pink_configuration,
@@ -52,10 +60,13 @@ for i in range(niter):
         damping=damping,
         solver=solver,
     )
-    q_out = pinocchio.integrate(robot.model, pink_configuration.q, dv * dt)
-    pink_configuration = pink.Configuration(robot.model, robot.data, q_out)
-    pinocchio.updateFramePlacements(robot.model, robot.data)
+    pink_configuration.integrate_inplace(dv, dt)
+    q_log[i + 1] = pink_configuration.q
     err = ee_task.compute_error(pink_configuration)
     print(i, err)
-    if np.linalg.norm(ee_task.compute_error(pink_configuration)) < 1e-8:
+    if np.linalg.norm(err) < 1e-8:
         break
+
+# Replay the IK iterations in MeshCat
+viz = start_meshcat_visualizer(robot)
+play_meshcat_animation(viz, q_log[: i + 2], fps=1.0 / dt)
@@ -37,6 +37,22 @@ except ModuleNotFoundError:
         "try ``pip install robot_descriptions``"
     )
 
+
+def se3_into(transform: pin.SE3, out: np.ndarray) -> np.ndarray:
+    """Write a transform into a preallocated homogeneous matrix.
+
+    Args:
+        transform: Transform to write.
+        out: Homogeneous matrix to write to, with its last row already set.
+
+    Returns:
+        The output matrix.
+    """
+    np.copyto(out[:3, :3], transform.rotation)
+    np.copyto(out[:3, 3], transform.translation)
+    return out
+
+
 # Trajectory parameters to play with ;)
 circle_radius = 0.5  # [m]
 fingertip_height = 0.7  # [m]
@@ -50,8 +66,12 @@ if __name__ == "__main__":
     # Initialize visualizer
     viz = start_meshcat_visualizer(robot)
     viewer = viz.viewer
-    meshcat_shapes.frame(viewer["base_target_frame"], opacity=0.5)
-    meshcat_shapes.frame(viewer["fingertip_target_frame"], opacity=1.0)
+    base_target_view = viewer["base_target_frame"]
+    fingertip_target_view = viewer["fingertip_target_frame"]
+    base_view = viewer["base_frame"]
+    fingertip_view = viewer["fingertip_frame"]
+    meshcat_shapes.frame(base_target_view, opacity=0.5)
+    meshcat_shapes.frame(fingertip_target_view, opacity=1.0)
 
     # Define tasks
     base_task = FrameTask(
@@ -69,45 +89,81 @@ if __name__ == "__main__":
     # Initialize tasks from the initial configuration
     configuration = pink.Configuration(robot.model, robot.data, robot.q0)
     base_task.set_target_from_configuration(configuration)
-    transform_fingertip_target_to_world = pin.SE3(
-        rotation=np.eye(3), translation=np.array([0.0, 0.0, fingertip_height])
-    ) * configuration.get_transform_frame_to_world(fingertip_task.body)
+    # Fingertip target: current fingertip pose raised by fingertip_height in
+    # the world frame (left-multiplication by a pure world translation)
+    transform_fingertip_target_to_world = (
+        configuration.get_transform_frame_to_world(fingertip_task.body)
+    )
+    transform_fingertip_target_to_world.translation[2] += fingertip_height
     center_translation = transform_fingertip_target_to_world.translation[:2]
     fingertip_task.set_target(transform_fingertip_target_to_world)
     viz.display(configuration.q)
 
-    # Select QP solver
+    # Select QP solver, preferring solvers that warm-start from initial values
     solver = qpsolvers.available_solvers[0]
-    if "quadprog" in qpsolvers.available_solvers:
-        solver = "quadprog"
+    for name in ("quadprog", "osqp", "proxqp"):  # by increasing preference
+        if name in qpsolvers.available_solvers:
+            solver = name
+
+    # Task targets are updated in place, and homogeneous matrices sent to the
+    # visualizer are written into preallocated buffers
+    T = base_task.transform_target_to_world
+    fingertip_target = fingertip_task.transform_target_to_world
+    buffers = {
+        name: np.eye(4)
+        for name in ("base_target", "fingertip_target", "base", "fingertip")
+    }
+    se3_into(fingertip_target, buffers["fingertip_target"])  # fixed target
 
     rate = RateLimiter(frequency=100.0)
     dt = rate.period
+
+    # The base yaw 0.5 * pi * t has a period of 4 [s], which is a whole number
+    # of control steps, so that we can tabulate base rotations once. Roll and
+    # pitch are zero so we only fill the four non-trivial entries of Rz(yaw).
+    nb_yaw_steps = int(round(4.0 / dt))
+    yaws = 0.5 * np.pi * dt * np.arange(nb_yaw_steps)
+    cos_yaws, sin_yaws = np.cos(yaws), np.sin(yaws)
+    yaw_rotations = np.zeros((nb_yaw_steps, 3, 3))
+    yaw_rotations[:, 0, 0] = cos_yaws
+    yaw_rotations[:, 0, 1] = -sin_yaws
+    yaw_rotations[:, 1, 0] = sin_yaws
+    yaw_rotations[:, 1, 1] = cos_yaws
+    yaw_rotations[:, 2, 2] = 1.0
+
+    display_every = max(1, int(1.0 / (30.0 * dt)))  # visualize at ~30 FPS
+    velocity = np.zeros(robot.model.nv)
+    u = np.empty(2)
+    step = 0
     t = 0.0  # [s]
     while True:
         # Update task targets
-        T = base_task.transform_target_to_world
-        u = np.array([np.cos(t), np.sin(t)])
-        T.translation[:2] = center_translation + circle_radius * u
-        T.rotation = pin.utils.rpyToMatrix(0.0, 0.0, 0.5 * np.pi * t)
-
-        # Update visualizer frames
-        viewer["base_target_frame"].set_transform(T.np)
-        viewer["fingertip_target_frame"].set_transform(
-            fingertip_task.transform_target_to_world.np
-        )
-        viewer["base_frame"].set_transform(
-            configuration.get_transform_frame_to_world(base_task.body).np
-        )
-        viewer["fingertip_frame"].set_transform(
-            configuration.get_transform_frame_to_world(fingertip_task.body).np
-        )
+        u[0] = circle_radius * np.cos(t)
+        u[1] = circle_radius * np.sin(t)
+        np.add(center_translation, u, out=T.translation[:2])
+        T.rotation = yaw_rotations[step % nb_yaw_steps]
 
-        # Compute velocity and integrate it into next configuration
-        velocity = solve_ik(configuration, tasks, dt, solver=solver)
+        # Compute velocity and integrate it into next configuration. The QP
+        # changes little between ticks, so we warm-start it from the previous
+        # displacement.
+        velocity = solve_ik(
+            configuration, tasks, dt, solver=solver, initvals=velocity * dt
+        )
         configuration.integrate_inplace(velocity, dt)
 
         # Visualize result at fixed FPS
-        viz.display(configuration.q)
+        if step % display_every == 0:
+            base = configuration.get_transform_frame_to_world(base_task.body)
+            fingertip = configuration.get_transform_frame_to_world(
+                fingertip_task.body
+            )
+            base_target_view.set_transform(se3_into(T, buffers["base_target"]))
+            fingertip_target_view.set_transform(buffers["fingertip_target"])
+            base_view.set_transform(se3_into(base, buffers["base"]))
+            fingertip_view.set_transform(
+                se3_into(fingertip, buffers["fingertip"])
+            )
+            viz.display(configuration.q)
         rate.sleep()
-        t += dt
+        step += 1
+        t = step * dt
@@ -18,7 +18,7 @@
 """Python inverse kinematics for your robot model based on Pinocchio."""
 
 from .configuration import Configuration
-from .solve_ik import build_ik, solve_ik
+from .solve_ik import batch_solve_ik, build_ik, solve_ik
 from .tasks import Task
 from .utils import custom_configuration_vector
 
@@ -26,6 +26,7 @@ __version__ = "0.10.0"
 
 __all__ = [
     "Configuration",
+    "batch_solve_ik",
     "build_ik",
     "custom_configuration_vector",
     "solve_ik",
@@ -17,12 +17,13 @@
 
 """Build and solve the inverse kinematics problem."""
 
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import qpsolvers
 
 from .configuration import Configuration
+from .exceptions import PinkError
 from .tasks import Task
 
 
@@ -163,7 +164,11 @@ def solve_ik(
             :math:`[\mathrm{tangent}]` is "the" unit of robot velocities.
             Improves numerical stability, but larger values slow down all
             tasks.
-        kwargs: Keyword arguments to forward to the backend QP solver.
+        kwargs: Keyword arguments to forward to the backend QP solver. For
+            instance, ``initvals`` warm-starts solvers that support it from an
+            initial guess of the configuration displacement
+            :math:`\Delta q = v \Delta t`, such as the one from the previous
+            control cycle.
 
     Returns:
         Velocity :math:`v` in tangent space.
@@ -184,3 +189,98 @@ def solve_ik(
     assert Delta_q is not None
     v: np.ndarray = Delta_q / dt
     return v
+
+
+def __solve_proxqp_in_parallel(
+    problems: Sequence[qpsolvers.Problem],
+    num_threads: Optional[int] = None,
+    **kwargs,
+) -> List[Optional[np.ndarray]]:
+    """Solve a batch of quadratic programs in parallel with ProxQP.
+
+    Args:
+        problems: Quadratic programs to solve.
+        num_threads: Number of threads to solve them with. Defaults to
+            ProxQP's choice if not specified.
+        kwargs: ProxQP settings applied to all problems, for instance
+            ``eps_abs``.
+
+    Returns:
+        Solution of each problem, or ``None`` if ProxQP did not solve it.
+    """
+    from proxsuite import proxqp  # optional dependency
+
+    qps = proxqp.dense.BatchQP()
+    for problem in problems:
+        P, q, G, h = problem.P, problem.q, problem.G, problem.h
+        n_in = G.shape[0] if G is not None else 0
+        qp = qps.init_qp_in_place(q.shape[0], 0, n_in)
+        for key, value in kwargs.items():
+            setattr(qp.settings, key, value)
+        h_min = np.full(h.shape, -np.inf) if h is not None else None
+        qp.init(P, q, None, None, G, h_min, h)
+    proxqp.dense.solve_in_parallel(qps, num_threads=num_threads)
+    solved = proxqp.QPSolverOutput.PROXQP_SOLVED
+    results = (qps.get(i).results for i in range(qps.size()))
+    return [r.x if r.info.status == solved else None for r in results]
+
+
+def batch_solve_ik(
+    configurations: Sequence[Configuration],
+    tasks_list: Sequence[Iterable[Task]],
+    dt: float,
+    solver: str,
+    damping: float = 1e-12,
+    **kwargs,
+) -> List[np.ndarray]:
+    r"""Compute velocities for a batch of independent IK problems.
+
+    This function is equivalent to calling :func:`solve_ik` on each pair of
+    configuration and tasks. With the ``"proxqp"`` solver, all quadratic
+    programs are solved in parallel by ProxQP, which requires proxsuite
+    0.7.0 or later. Other solvers go through qpsolvers one problem after the
+    other.
+
+    Args:
+        configurations: Robot configurations to read kinematics from.
+        tasks_list: List of kinematic tasks for each configuration.
+        dt: Integration timestep in [s].
+        solver: Backend quadratic programming (QP) solver.
+        damping: weight of Tikhonov (everywhere) regularization. Its unit is
+            :math:`[\mathrm{cost}]^2 / [\mathrm{tangent}]` where
+            :math:`[\mathrm{tangent}]` is "the" unit of robot velocities.
+            Improves numerical stability, but larger values slow down all
+            tasks.
+        kwargs: Keyword arguments to forward to the backend QP solver. With
+            ``"proxqp"``, these are ProxQP settings plus an optional
+            ``num_threads``.
+
+    Returns:
+        Velocity :math:`v` in tangent space for each configuration.
+
+    Raises:
+        NotWithinConfigurationLimits: if one of the configurations is not
+            within limits.
+        PinkError: if there are not as many task lists as configurations.
+    """
+    if len(configurations) != len(tasks_list):
+        raise PinkError(
+            f"got {len(configurations)} configurations "
+            f"but {len(tasks_list)} task lists"
+        )
+    problems = [
+        build_ik(configuration, tasks, dt, damping)
+        for configuration, tasks in zip(configurations, tasks_list)
+    ]
+    if solver == "proxqp":
+        Delta_qs = __solve_proxqp_in_parallel(problems, **kwargs)
+    else:  # solver != "proxqp"
+        Delta_qs = [
+            qpsolvers.solve_problem(problem, solver=solver, **kwargs).x
+            for problem in problems
+        ]
+    velocities: List[np.ndarray] = []
+    for Delta_q in Delta_qs:
+        assert Delta_q is not None
+        velocities.append(Delta_q / dt)
+    return velocities
@@ -217,8 +217,8 @@ class FrameTask(Task):
         transform_frame_to_world = configuration.get_transform_frame_to_world(
             self.body
         )
-        transform_frame_to_target = (
-            self.transform_target_to_world.inverse() * transform_frame_to_world
+        transform_frame_to_target = self.transform_target_to_world.actInv(
+            transform_frame_to_world
         )
         J = pin.Jlog6(transform_frame_to_target) @ jacobian_in_frame
         return J
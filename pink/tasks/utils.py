@@ -21,6 +21,114 @@ import numpy as np
 import pinocchio as pin
 
 
+def __check_transform_stack(H: np.ndarray, name: str) -> None:
+    """Check that an array is a stack of homogeneous transform matrices.
+
+    Args:
+        H: Array to check.
+        name: Name of the array in error messages.
+
+    Raises:
+        ValueError: If the array does not have shape :math:`(B, 4, 4)`.
+    """
+    if H.ndim != 3 or H.shape[1:] != (4, 4):
+        raise ValueError(
+            f"{name} should be a stack of homogeneous transforms of shape "
+            f"(B, 4, 4), but its shape is {H.shape}"
+        )
+
+
+def __log3_batch(R: np.ndarray) -> np.ndarray:
+    r"""Compute the logarithm of a stack of rotation matrices.
+
+    Args:
+        R: Stack of rotation matrices, of shape :math:`(B, 3, 3)`.
+
+    Returns:
+        Stack of rotation vectors :math:`\omega` such that
+        :math:`\exp(\omega) = R`, of shape :math:`(B, 3)`.
+    """
+    vee = np.stack(
+        (
+            R[:, 2, 1] - R[:, 1, 2],
+            R[:, 0, 2] - R[:, 2, 0],
+            R[:, 1, 0] - R[:, 0, 1],
+        ),
+        axis=1,
+    )
+    cos_theta = np.clip(0.5 * (np.trace(R, axis1=1, axis2=2) - 1.0), -1, 1)
+    sin_theta = 0.5 * np.linalg.norm(vee, axis=1)
+    theta = np.arctan2(sin_theta, cos_theta)  # better conditioned than arccos
+
+    # Away from pi, omega = theta / (2 sin(theta)) * vee(R - R^T) with a
+    # Taylor expansion of the factor around zero
+    small = theta < 1e-4
+    safe_sin = np.where(small, 1.0, sin_theta)
+    factor = np.where(small, 0.5 + theta**2 / 12.0, 0.5 * theta / safe_sin)
+    omega = factor[:, None] * vee
+
+    # Close to pi, vee(R - R^T) vanishes and we recover the rotation axis from
+    # the symmetric part of R instead
+    near_pi = theta > np.pi - 1e-2
+    if np.any(near_pi):
+        R_pi = R[near_pi]
+        one_minus_cos = 1.0 - cos_theta[near_pi]
+        diag = np.diagonal(R_pi, axis1=1, axis2=2)
+        k = np.argmax(diag, axis=1)
+        rows = np.arange(R_pi.shape[0])
+        a_k = np.sqrt(
+            np.maximum(diag[rows, k] - cos_theta[near_pi], 0.0) / one_minus_cos
+        )
+        a_k = np.where(vee[near_pi][rows, k] < 0.0, -a_k, a_k)
+        axis = (R_pi[rows, k, :] + R_pi[rows, :, k]) / (
+            2.0 * one_minus_cos * a_k
+        )[:, None]
+        axis[rows, k] = a_k
+        omega[near_pi] = theta[near_pi, None] * axis
+    return omega
+
+
+def __log6_batch(H: np.ndarray) -> np.ndarray:
+    r"""Compute the logarithm of a stack of homogeneous transforms.
+
+    Args:
+        H: Stack of homogeneous transform matrices, of shape
+            :math:`(B, 4, 4)`.
+
+    Returns:
+        Stack of twists, of shape :math:`(B, 6)`, in Pinocchio's convention
+        (linear coordinates followed by angular coordinates).
+    """
+    R = H[:, :3, :3]
+    p = H[:, :3, 3]
+    omega = __log3_batch(R)
+    theta = np.linalg.norm(omega, axis=1)
+
+    # Inverse of the left Jacobian of SO(3):
+    # V^{-1} = I - [omega]_x / 2 + alpha [omega]_x^2
+    small = theta < 1e-4
+    safe_theta = np.where(small, 1.0, theta)
+    alpha = np.where(
+        small,
+        1.0 / 12.0 + theta**2 / 720.0,
+        (
+            1.0
+            - 0.5
+            * safe_theta
+            * np.sin(safe_theta)
+            / (1.0 - np.cos(safe_theta))
+        )
+        / safe_theta**2,
+    )
+    omega_cross_p = np.cross(omega, p)
+    v = (
+        p
+        - 0.5 * omega_cross_p
+        + alpha[:, None] * np.cross(omega, omega_cross_p)
+    )
+    return np.hstack((v, omega))
+
+
 def spatial_minus(Y: pin.SE3, X: pin.SE3) -> np.ndarray:
     r"""Compute the left minus :math:`Y \ominus_0 X`.
 
@@ -100,3 +208,68 @@ def body_minus(Y: pin.SE3, X: pin.SE3) -> np.ndarray:
     """
     body_twist: np.ndarray = pin.log(X.actInv(Y)).vector
     return body_twist
+
+
+def spatial_minus_batch(Y: np.ndarray, X: np.ndarray) -> np.ndarray:
+    r"""Compute the left minus :func:`spatial_minus` over stacks of transforms.
+
+    Args:
+        Y: Stack of homogeneous transform matrices :math:`Y_i = T_{0y_i}`, of
+            shape :math:`(B, 4, 4)`.
+        X: Stack of homogeneous transform matrices :math:`X_i = T_{0x_i}`, of
+            shape :math:`(B, 4, 4)`.
+
+    Returns:
+        Stack of spatial motion vectors :math:`Y_i \ominus_0 X_i`, of shape
+        :math:`(B, 6)`.
+
+    Raises:
+        ValueError: If the two stacks do not both have shape
+            :math:`(B, 4, 4)`.
+    """
+    __check_transform_stack(Y, "Y")
+    __check_transform_stack(X, "X")
+    if Y.shape != X.shape:
+        raise ValueError(
+            f"Y and X should have the same shape, got {Y.shape} and {X.shape}"
+        )
+    # Y * X^{-1} with rotation R_y R_x^T and translation p_y - R p_x
+    H = np.zeros(Y.shape)
+    H[:, :3, :3] = Y[:, :3, :3] @ np.swapaxes(X[:, :3, :3], 1, 2)
+    H[:, :3, 3] = Y[:, :3, 3] - np.einsum(
+        "bij,bj->bi", H[:, :3, :3], X[:, :3, 3]
+    )
+    H[:, 3, 3] = 1.0
+    return __log6_batch(H)
+
+
+def body_minus_batch(Y: np.ndarray, X: np.ndarray) -> np.ndarray:
+    r"""Compute the right minus :func:`body_minus` over stacks of transforms.
+
+    Args:
+        Y: Stack of homogeneous transform matrices :math:`Y_i = T_{0y_i}`, of
+            shape :math:`(B, 4, 4)`.
+        X: Stack of homogeneous transform matrices :math:`X_i = T_{0x_i}`, of
+            shape :math:`(B, 4, 4)`.
+
+    Returns:
+        Stack of body motion vectors :math:`Y_i \ominus X_i`, of shape
+        :math:`(B, 6)`.
+
+    Raises:
+        ValueError: If the two stacks do not both have shape
+            :math:`(B, 4, 4)`.
+    """
+    __check_transform_stack(Y, "Y")
+    __check_transform_stack(X, "X")
+    if Y.shape != X.shape:
+        raise ValueError(
+            f"Y and X should have the same shape, got {Y.shape} and {X.shape}"
+        )
+    # X^{-1} * Y with rotation R_x^T R_y and translation R_x^T (p_y - p_x)
+    R_x_T = np.swapaxes(X[:, :3, :3], 1, 2)
+    H = np.zeros(Y.shape)
+    H[:, :3, :3] = R_x_T @ Y[:, :3, :3]
+    H[:, :3, 3] = np.einsum("bij,bj->bi", R_x_T, Y[:, :3, 3] - X[:, :3, 3])
+    H[:, 3, 3] = 1.0
+    return __log6_batch(H)
@@ -17,7 +17,7 @@
 
 """Utility classes and functions."""
 
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 import pinocchio as pin
@@ -26,22 +26,40 @@ from .exceptions import PinkError
 
 
 def custom_configuration_vector(robot: pin.Model, **kwargs) -> np.ndarray:
-    """Generate a configuration vector where named joints have specific values.
+    r"""Generate a configuration vector where named joints have given values.
 
     Args:
         robot: Robot model.
-        kwargs: Custom values for joint coordinates.
+        kwargs: Custom values for joint coordinates. A value can also be a
+            vector of length :math:`B`, in which case the function returns a
+            batch of configuration vectors.
 
     Returns:
         Configuration vector where named joints have the values specified in
-        keyword arguments, and other joints have their neutral value.
+        keyword arguments, and other joints have their neutral value. If any
+        keyword argument is a vector, this is a :math:`B \times n_q` matrix
+        whose rows are configuration vectors (scalar values are broadcast to
+        all rows).
     """
     q = pin.neutral(robot.model)
-    for joint_name, joint_value in kwargs.items():
-        joint_id = robot.model.getJointId(joint_name)
-        joint = robot.model.joints[joint_id]
-        q[joint.idx_q] = joint_value
-    return q
+    if not kwargs:
+        return q
+    idx_q = np.fromiter(
+        (
+            robot.model.joints[robot.model.getJointId(joint_name)].idx_q
+            for joint_name in kwargs
+        ),
+        dtype=int,
+        count=len(kwargs),
+    )
+    values = [np.asarray(value, dtype=float) for value in kwargs.values()]
+    if all(value.ndim == 0 for value in values):
+        q[idx_q] = values
+        return q
+    columns = np.broadcast_arrays(*values)
+    q_batch = np.tile(q, (columns[0].shape[0], 1))
+    q_batch[:, idx_q] = np.stack(columns, axis=1)
+    return q_batch
 
 
 def get_root_joint_dim(model: pin.Model) -> Tuple[int, int]:
@@ -82,39 +100,71 @@ def get_joint_idx(model: pin.Model, joint_name: str) -> Tuple[int, int]:
 
 
 class VectorSpace:
-    """Wrapper to refer to a vector space and its characteristic matrices."""
+    """Wrapper to refer to a vector space and its characteristic matrices.
+
+    Vector spaces of the same dimension are shared: instantiating a dimension
+    that was already created returns the existing instance. Characteristic
+    matrices are read-only, and only allocated the first time they are
+    accessed.
+    """
 
-    __eye: np.ndarray
-    __ones: np.ndarray
-    __zeros: np.ndarray
+    __instances: Dict[int, "VectorSpace"] = {}
+    __dim: int
+    __eye: Optional[np.ndarray]
+    __ones: Optional[np.ndarray]
+    __zeros: Optional[np.ndarray]
 
-    def __init__(self, dim: int):
-        """Create new vector space description.
+    def __new__(cls, dim: int):
+        """Get the vector space of a given dimension.
 
         Args:
             dim: Dimension.
         """
-        eye = np.eye(dim)
-        ones = np.ones(dim)
-        zeros = np.zeros(dim)
-        eye.setflags(write=False)
-        ones.setflags(write=False)
-        zeros.setflags(write=False)
-        self.__eye = eye
-        self.__ones = ones
-        self.__zeros = zeros
+        instance = cls.__instances.get(dim)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.__dim = dim
+            instance.__eye = None
+            instance.__ones = None
+            instance.__zeros = None
+            cls.__instances[dim] = instance
+        return instance
+
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """Unpickle vector spaces to the shared instance of their dimension."""
+        return (self.__class__, (self.__dim,))
+
+    def __copy__(self) -> "VectorSpace":
+        """Copies of a vector space are the shared instance itself."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "VectorSpace":
+        """Deep copies of a vector space are the shared instance itself."""
+        return self
 
     @property
     def eye(self) -> np.ndarray:
         """Identity matrix from and to the vector space."""
+        if self.__eye is None:
+            eye = np.eye(self.__dim)
+            eye.setflags(write=False)
+            self.__eye = eye
         return self.__eye
 
     @property
     def ones(self) -> np.ndarray:
         """Vector full of ones, dimension of the space."""
+        if self.__ones is None:
+            ones = np.ones(self.__dim)
+            ones.setflags(write=False)
+            self.__ones = ones
         return self.__ones
 
     @property
     def zeros(self) -> np.ndarray:
         """Zero vector of the space."""
+        if self.__zeros is None:
+            zeros = np.zeros(self.__dim)
+            zeros.setflags(write=False)
+            self.__zeros = zeros
         return self.__zeros
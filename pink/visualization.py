@@ -17,6 +17,7 @@
 
 """Visualization helpers."""
 
+import numpy as np
 import pinocchio as pin
 
 
@@ -36,3 +37,36 @@ def start_meshcat_visualizer(robot: pin.RobotWrapper):
     viz.initViewer(open=True)
     viz.loadViewerModel()
     return viz
+
+
+def play_meshcat_animation(viz, q_trajectory: np.ndarray, fps: float) -> None:
+    """Replay a trajectory in MeshCat as a single animation.
+
+    Calling ``viz.display`` at each step sends one message per geometry and
+    per step. This function instead sends the whole trajectory to MeshCat in
+    one message, after which the viewer plays it back on its own.
+
+    Args:
+        viz: MeshCat visualizer, for instance from
+            :func:`start_meshcat_visualizer`.
+        q_trajectory: Configuration vectors of the trajectory, one per row.
+        fps: Frame rate of the animation, in frames per second.
+    """
+    from meshcat.animation import Animation
+
+    model, data = viz.model, viz.data
+    visual_model, visual_data = viz.visual_model, viz.visual_data
+
+    # Animations only set positions and orientations, so we display the
+    # initial configuration first to apply mesh scales
+    viz.display(q_trajectory[0])
+    animation = Animation(default_framerate=fps)
+    for frame_index, q in enumerate(q_trajectory):
+        pin.forwardKinematics(model, data, q)
+        pin.updateGeometryPlacements(model, data, visual_model, visual_data)
+        with animation.at_frame(viz.viewer, frame_index) as frame:
+            for visual in visual_model.geometryObjects:
+                geom_id = visual_model.getGeometryId(visual.name)
+                node = viz.getViewerNodeName(visual, pin.GeometryType.VISUAL)
+                frame[node].set_transform(visual_data.oMg[geom_id].homogeneous)
+    viz.viewer.set_animation(animation)
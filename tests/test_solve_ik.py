@@ -25,8 +25,8 @@ import qpsolvers
 from numpy.linalg import norm
 from robot_descriptions.loaders.pinocchio import load_robot_description
 
-from pink import Configuration, build_ik, solve_ik
-from pink.exceptions import NotWithinConfigurationLimits
+from pink import Configuration, batch_solve_ik, build_ik, solve_ik
+from pink.exceptions import NotWithinConfigurationLimits, PinkError
 from pink.tasks import FrameTask
 
 
@@ -256,6 +256,81 @@ class TestSolveIK(unittest.TestCase):
             0.5,
         )
 
+    def test_batch_solve_ik(self):
+        """Batch IK yields the same velocities as individual IK calls."""
+        robot = load_robot_description(
+            "upkie_description", root_joint=pin.JointModelFreeFlyer()
+        )
+        configurations = []
+        tasks_list = []
+        for offset in (0.05, 0.1, 0.2):
+            configuration = Configuration(robot.model, robot.data, robot.q0)
+            task = FrameTask(
+                "left_contact", position_cost=1.0, orientation_cost=1.0
+            )
+            transform_target_to_world = (
+                configuration.get_transform_frame_to_world("left_contact")
+            )
+            transform_target_to_world.translation[2] += offset
+            task.set_target(transform_target_to_world)
+            configurations.append(configuration)
+            tasks_list.append([task])
+        dt = 5e-3  # [s]
+        velocities = batch_solve_ik(
+            configurations, tasks_list, dt, solver="quadprog"
+        )
+        self.assertEqual(len(velocities), len(configurations))
+        for configuration, tasks, velocity in zip(
+            configurations, tasks_list, velocities
+        ):
+            self.assertTrue(
+                np.allclose(
+                    velocity,
+                    solve_ik(configuration, tasks, dt, solver="quadprog"),
+                )
+            )
+
+    def test_batch_solve_ik_length_mismatch(self):
+        """Batch IK needs one task list per configuration."""
+        model = pin.Model()
+        model.addJoint(
+            0, pin.JointModelSpherical(), pin.SE3.Identity(), "spherical"
+        )
+        robot = pin.RobotWrapper(model=model)
+        configuration = Configuration(robot.model, robot.data, robot.q0)
+        with self.assertRaises(PinkError):
+            batch_solve_ik(
+                [configuration, configuration, configuration],
+                [[], []],
+                dt=1.0,
+                solver="quadprog",
+            )
+
+    @unittest.skipIf(
+        "proxqp" not in qpsolvers.available_solvers, "ProxQP not installed"
+    )  # proxsuite is only in test dependencies from Python 3.8
+    def test_batch_solve_ik_proxqp(self):
+        """Parallel ProxQP solutions reach the same IK objective values."""
+        configuration, tasks, dt = self.get_jvrc_problem()
+        tasks[0].transform_target_to_world.translation[2] -= 0.1
+        configurations = [configuration, configuration]
+        tasks_list = [tasks, tasks[:1]]
+        velocities = batch_solve_ik(
+            configurations, tasks_list, dt, solver="proxqp", eps_abs=1e-9
+        )
+        for tasks, velocity in zip(tasks_list, velocities):
+            problem = build_ik(configuration, tasks, dt)
+            Delta_q = velocity * dt
+            Delta_q_ref = (
+                solve_ik(configuration, tasks, dt, solver="quadprog") * dt
+            )
+            self.assertAlmostEqual(
+                0.5 * Delta_q @ problem.P @ Delta_q + problem.q @ Delta_q,
+                0.5 * Delta_q_ref @ problem.P @ Delta_q_ref
+                + problem.q @ Delta_q_ref,
+                places=6,
+            )
+
     def get_jvrc_problem(self):
         """Get an IK problem with three tasks on a humanoid model."""
         robot = load_robot_description(
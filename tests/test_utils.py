@@ -18,32 +18,61 @@
 
 """Test fixture for other library features."""
 
+import copy
+import pickle
 import unittest
 
 import numpy as np
 import pinocchio as pin
 from robot_descriptions.loaders.pinocchio import load_robot_description
 
-from pink.tasks.utils import body_minus, spatial_minus
+from pink import Configuration
+from pink.tasks.utils import (
+    body_minus,
+    body_minus_batch,
+    spatial_minus,
+    spatial_minus_batch,
+)
 from pink.utils import VectorSpace, custom_configuration_vector
 
 
 class TestUtils(unittest.TestCase):
     """Test utility classes and functions."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Load the robot description shared by all tests once."""
+        cls.robot = load_robot_description(
+            "upkie_description", root_joint=pin.JointModelFreeFlyer()
+        )
+
     def test_custom_configuration_vector(self):
         """Check a custom configuration vector for Upkie.
 
         Assumes the left and right knees have joint indices respectively 8 and
         11 in the configuration vector.
         """
-        robot = load_robot_description(
-            "upkie_description", root_joint=pin.JointModelFreeFlyer()
-        )
+        robot = self.robot
         q = custom_configuration_vector(robot, left_knee=0.2, right_knee=-0.2)
         self.assertAlmostEqual(q[8], 0.2)
         self.assertAlmostEqual(q[11], -0.2)
 
+    def test_custom_configuration_vector_batch(self):
+        """Check a batch of custom configuration vectors for Upkie."""
+        robot = self.robot
+        left_knees = np.array([0.1, 0.2, 0.3])
+        q_batch = custom_configuration_vector(
+            robot, left_knee=left_knees, right_knee=-0.2
+        )
+        self.assertEqual(q_batch.shape, (3, robot.model.nq))
+        self.assertTrue(np.allclose(q_batch[:, 8], left_knees))
+        self.assertTrue(np.allclose(q_batch[:, 11], -0.2))
+        for i, left_knee in enumerate(left_knees):
+            q = custom_configuration_vector(
+                robot, left_knee=left_knee, right_knee=-0.2
+            )
+            self.assertTrue(np.allclose(q_batch[i], q))
+
     def test_minus(self):
         """Test Lie minus operators."""
         X = pin.SE3.Random()
@@ -51,13 +80,70 @@ class TestUtils(unittest.TestCase):
         self.assertTrue(np.allclose(Y, X * pin.exp6(body_minus(Y, X))))
         self.assertTrue(np.allclose(Y, pin.exp6(spatial_minus(Y, X)) * X))
 
+    def test_minus_batch(self):
+        """Lie minus operators on stacks of homogeneous transforms."""
+        rng = np.random.default_rng(42)
+        B = 1024
+        X_list = [pin.exp6(twist) for twist in rng.normal(size=(B, 6))]
+        Y_list = [pin.exp6(twist) for twist in rng.normal(size=(B, 6))]
+        X = np.array([X_i.homogeneous for X_i in X_list])
+        Y = np.array([Y_i.homogeneous for Y_i in Y_list])
+        body_twists = body_minus_batch(Y, X)
+        spatial_twists = spatial_minus_batch(Y, X)
+        self.assertEqual(body_twists.shape, (B, 6))
+        self.assertEqual(spatial_twists.shape, (B, 6))
+        self.assertTrue(
+            np.allclose(
+                body_twists,
+                [body_minus(Y_i, X_i) for Y_i, X_i in zip(Y_list, X_list)],
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                spatial_twists,
+                [spatial_minus(Y_i, X_i) for Y_i, X_i in zip(Y_list, X_list)],
+            )
+        )
+
+    def test_minus_batch_shapes(self):
+        """Batch Lie minus operators only accept stacks of transforms."""
+        X = np.tile(np.eye(4), (3, 1, 1))
+        for minus in (body_minus_batch, spatial_minus_batch):
+            with self.assertRaises(ValueError):
+                minus(np.eye(4), np.eye(4))
+            with self.assertRaises(ValueError):
+                minus(X[:2], X)
+
     def test_vector_space(self):
         """Check dimensions of regular tangent space."""
-        robot = load_robot_description(
-            "upkie_description", root_joint=pin.JointModelFreeFlyer()
-        )
+        robot = self.robot
         nv = robot.model.nv
         tangent = VectorSpace(robot.model.nv)
         self.assertEqual(tangent.eye.shape, (nv, nv))
         self.assertEqual(tangent.ones.shape, (nv,))
         self.assertEqual(tangent.zeros.shape, (nv,))
+
+    def test_vector_space_is_shared(self):
+        """Vector spaces of the same dimension share read-only matrices."""
+        tangent = VectorSpace(self.robot.model.nv)
+        self.assertIs(VectorSpace(self.robot.model.nv), tangent)
+        self.assertIsNot(VectorSpace(self.robot.model.nv + 1), tangent)
+        self.assertIs(VectorSpace(self.robot.model.nv).eye, tangent.eye)
+        with self.assertRaises(ValueError):
+            tangent.eye[0, 0] = 2.0
+
+    def test_vector_space_copy_and_pickle(self):
+        """Copies and unpickled vector spaces are the shared instance."""
+        tangent = VectorSpace(self.robot.model.nv)
+        self.assertIs(copy.copy(tangent), tangent)
+        self.assertIs(copy.deepcopy(tangent), tangent)
+        self.assertIs(pickle.loads(pickle.dumps(tangent)), tangent)
+        configuration = Configuration(
+            self.robot.model, self.robot.data, self.robot.q0
+        )
+        for other in (
+            copy.deepcopy(configuration),
+            pickle.loads(pickle.dumps(configuration)),
+        ):
+            self.assertIs(other.tangent, configuration.tangent)
+            self.assertTrue(np.allclose(other.q, configuration.q))